@@ -113,6 +113,11 @@ class DatasetRegistry:
     """
 
     _registry: ClassVar[dict[str, DatasetDefinition]] = {}
+    # Custom dataset files already seen, keyed by path, with the (mtime_ns, size)
+    # they had at that point and the definition they produced (None if invalid)
+    _custom_files: ClassVar[
+        dict[str, tuple[tuple[int, int], DatasetDefinition | None]]
+    ] = {}
 
     @classmethod
     def register(cls, dataset: DatasetDefinition):
@@ -157,6 +162,7 @@ class DatasetRegistry:
     def reset(cls):
         """Clear registry and re-register built-in datasets."""
         cls._registry.clear()
+        cls._custom_files.clear()
         cls._register_builtins()
 
     @classmethod
@@ -168,6 +174,10 @@ class DatasetRegistry:
 
         If not specified, defaults to TABULAR modality.
 
+        This runs whenever dataset paths are resolved, so files that are
+        unchanged since they were last seen are not parsed (or reported as
+        invalid) again.
+
         Args:
             custom_dir: Directory containing custom dataset JSON files
         """
@@ -176,13 +186,28 @@ class DatasetRegistry:
             return
 
         for f in custom_dir.glob("*.json"):
+            key = str(f)
             try:
+                stat = f.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+                # Skip unchanged files that were invalid or whose definition is
+                # still registered
+                cached = cls._custom_files.get(key)
+                if cached is not None and cached[0] == signature:
+                    loaded = cached[1]
+                    if (
+                        loaded is None
+                        or cls._registry.get(loaded.name.lower()) is loaded
+                    ):
+                        continue
+
                 # Check file size to prevent DoS via large files
-                if f.stat().st_size > MAX_DATASET_FILE_SIZE:
+                if stat.st_size > MAX_DATASET_FILE_SIZE:
                     logger.warning(
                         f"Dataset file too large (>{MAX_DATASET_FILE_SIZE} bytes), "
                         f"skipping: {f}"
                     )
+                    cls._custom_files[key] = (signature, None)
                     continue
 
                 data = json.loads(f.read_text())
@@ -202,14 +227,21 @@ class DatasetRegistry:
 
                 ds = DatasetDefinition(**data)
                 cls.register(ds)
+                cls._custom_files[key] = (signature, ds)
                 logger.debug(f"Loaded custom dataset: {ds.name}")
+            except OSError as e:
+                # Not cached: permission or I/O problems can clear up without
+                # the file itself changing
+                logger.warning(f"Failed to load custom dataset from {f}: {e}")
             except KeyError as e:
                 logger.warning(
                     f"Failed to load custom dataset from {f}: "
                     f"Invalid modality name: {e}"
                 )
+                cls._custom_files[key] = (signature, None)
             except Exception as e:
                 logger.warning(f"Failed to load custom dataset from {f}: {e}")
+                cls._custom_files[key] = (signature, None)
 
     @classmethod
     def _register_builtins(cls):
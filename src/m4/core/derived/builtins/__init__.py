@@ -18,6 +18,9 @@ _DATASET_DIRS: dict[str, str] = {
     "mimic-iv": "mimic_iv",
 }
 
+# Matches ".read <relative path>" directives in the orchestrator file
+_READ_DIRECTIVE = re.compile(r"^\.read\s+(.+)$")
+
 
 def get_execution_order(dataset_name: str) -> list[Path]:
     """Parse the duckdb.sql orchestrator to get SQL files in dependency order.
@@ -50,11 +53,10 @@ def get_execution_order(dataset_name: str) -> list[Path]:
         raise FileNotFoundError(f"Orchestrator file not found: {orchestrator}")
 
     # Parse .read directives from the orchestrator file
-    read_pattern = re.compile(r"^\.read\s+(.+)$")
     sql_files: list[Path] = []
 
     for line in orchestrator.read_text().splitlines():
-        match = read_pattern.match(line.strip())
+        match = _READ_DIRECTIVE.match(line.strip())
         if match:
             relative_path = match.group(1).strip()
             sql_path = dataset_dir / relative_path
@@ -5,33 +5,56 @@ and sanitizing user input before execution. These are used by tool
 classes to prevent SQL injection and other attacks.
 """
 
+import functools
 import re
 
 import sqlparse
 
-
-def is_safe_query(sql_query: str) -> tuple[bool, str]:
-    """Validate SQL query for injection attacks and dangerous operations.
-
-    This function performs comprehensive security validation:
-    1. Blocks multiple statements (main injection vector)
-    2. Allows only SELECT and PRAGMA queries
-    3. Blocks dangerous write operations within SELECT
-    4. Detects common injection patterns
-    5. Blocks suspicious table/column names
-
-    Args:
-        sql_query: The SQL query string to validate
-
-    Returns:
-        Tuple of (is_safe, message). If safe, message is "Safe" or similar.
-        If not safe, message explains why.
-
-    Example:
-        is_safe, msg = is_safe_query("SELECT * FROM patients LIMIT 10")
-        if not is_safe:
-            raise ValueError(f"Unsafe query: {msg}")
-    """
+# Common injection patterns, compiled once at import time since every query
+# goes through is_safe_query(). Use \s* to handle variations with spaces
+# (e.g., "1 = 1" vs "1=1").
+_INJECTION_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), description)
+    for pattern, description in (
+        (r"\b\d+\s*=\s*\d+\b", "Classic injection pattern (tautology)"),
+        (r"\bOR\s+\d+\s*=\s*\d+", "Boolean injection pattern"),
+        (r"\bAND\s+\d+\s*=\s*\d+", "Boolean injection pattern"),
+        (r"\bOR\s+['\"].*['\"]\s*=\s*['\"]", "String injection pattern"),
+        (r"\bAND\s+['\"].*['\"]\s*=\s*['\"]", "String injection pattern"),
+        (r"\bWAITFOR\b", "Time-based injection"),
+        (r"\bSLEEP\s*\(", "Time-based injection"),
+        (r"\bBENCHMARK\s*\(", "Time-based injection"),
+        (r"\bLOAD_FILE\s*\(", "File access injection"),
+        (r"\bINTO\s+OUTFILE\b", "File write injection"),
+        (r"\bINTO\s+DUMPFILE\b", "File write injection"),
+    )
+)
+
+# Identifiers not found in medical databases, fused into one alternation so a
+# query is scanned once. Word boundaries match standalone words only, which
+# allows legitimate column names like "PRIMARY_KEY" or "SESSION_ID" but blocks
+# a standalone "PASSWORD".
+_SUSPICIOUS_NAMES = (
+    "PASSWORD",
+    "ADMIN",
+    "LOGIN",
+    "AUTH",
+    "TOKEN",
+    "CREDENTIAL",
+    "SECRET",
+    "HASH",
+    "SALT",
+    "COOKIE",
+)
+_SUSPICIOUS_NAME_PATTERN = re.compile(rf"\b({'|'.join(_SUSPICIOUS_NAMES)})\b")
+
+# A single unquoted SQL identifier (one part of a schema.table name)
+_IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+
+@functools.lru_cache(maxsize=256)
+def _check_query(sql_query: str) -> tuple[bool, str]:
+    """Run the checks for is_safe_query(), memoized per query string."""
     try:
         if not sql_query or not sql_query.strip():
             return False, "Empty query"
@@ -82,49 +105,18 @@ def is_safe_query(sql_query: str) -> tuple[bool, str]:
                     return False, f"Write operation not allowed: {keyword}"
 
             # Block common injection patterns using regex for flexible matching
-            # Use \s* to handle variations with spaces (e.g., "1 = 1" vs "1=1")
-            injection_regex_patterns = [
-                (r"\b\d+\s*=\s*\d+\b", "Classic injection pattern (tautology)"),
-                (r"\bOR\s+\d+\s*=\s*\d+", "Boolean injection pattern"),
-                (r"\bAND\s+\d+\s*=\s*\d+", "Boolean injection pattern"),
-                (r"\bOR\s+['\"].*['\"]\s*=\s*['\"]", "String injection pattern"),
-                (r"\bAND\s+['\"].*['\"]\s*=\s*['\"]", "String injection pattern"),
-                (r"\bWAITFOR\b", "Time-based injection"),
-                (r"\bSLEEP\s*\(", "Time-based injection"),
-                (r"\bBENCHMARK\s*\(", "Time-based injection"),
-                (r"\bLOAD_FILE\s*\(", "File access injection"),
-                (r"\bINTO\s+OUTFILE\b", "File write injection"),
-                (r"\bINTO\s+DUMPFILE\b", "File write injection"),
-            ]
-
-            for pattern, description in injection_regex_patterns:
-                if re.search(pattern, sql_upper, re.IGNORECASE):
+            for pattern, description in _INJECTION_PATTERNS:
+                if pattern.search(sql_upper):
                     return False, f"Injection pattern detected: {description}"
 
             # Block suspicious identifiers not found in medical databases
-            # Use word boundary matching to avoid false positives on legitimate
-            # column names like "PRIMARY_KEY", "FOREIGN_KEY", "SESSION_ID" etc.
-            suspicious_names = [
-                "PASSWORD",
-                "ADMIN",
-                "LOGIN",
-                "AUTH",
-                "TOKEN",
-                "CREDENTIAL",
-                "SECRET",
-                "HASH",
-                "SALT",
-                "COOKIE",
-            ]
-
-            for name in suspicious_names:
-                # Use word boundary regex to match standalone words only
-                # This allows "PRIMARY_KEY" but blocks standalone "PASSWORD"
-                if re.search(rf"\b{name}\b", sql_upper):
-                    return (
-                        False,
-                        f"Suspicious identifier detected: {name} (not medical data)",
-                    )
+            match = _SUSPICIOUS_NAME_PATTERN.search(sql_upper)
+            if match:
+                return (
+                    False,
+                    f"Suspicious identifier detected: {match.group(1)} "
+                    "(not medical data)",
+                )
 
         return True, "Safe"
 
@@ -132,6 +124,39 @@ def is_safe_query(sql_query: str) -> tuple[bool, str]:
         return False, f"Validation error: {e}"
 
 
+def is_safe_query(sql_query: str) -> tuple[bool, str]:
+    """Validate SQL query for injection attacks and dangerous operations.
+
+    This function performs comprehensive security validation:
+    1. Blocks multiple statements (main injection vector)
+    2. Allows only SELECT and PRAGMA queries
+    3. Blocks dangerous write operations within SELECT
+    4. Detects common injection patterns
+    5. Blocks suspicious table/column names
+
+    Results are memoized per query string, since the same SQL is often
+    validated repeatedly (e.g. the cohort builder regenerates identical
+    queries as filters are toggled) and parsing dominates the cost.
+
+    Args:
+        sql_query: The SQL query string to validate
+
+    Returns:
+        Tuple of (is_safe, message). If safe, message is "Safe" or similar.
+        If not safe, message explains why.
+
+    Example:
+        is_safe, msg = is_safe_query("SELECT * FROM patients LIMIT 10")
+        if not is_safe:
+            raise ValueError(f"Unsafe query: {msg}")
+    """
+    if not isinstance(sql_query, str):
+        if not sql_query:
+            return False, "Empty query"
+        return False, f"Validation error: expected str, got {type(sql_query).__name__}"
+    return _check_query(sql_query)
+
+
 def validate_table_name(table_name: str) -> bool:
     """Validate a table name to prevent SQL injection.
 
@@ -158,9 +183,8 @@ def validate_table_name(table_name: str) -> bool:
         return False
 
     # Each part must be a valid identifier
-    identifier_re = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
     for part in parts:
-        if not identifier_re.match(part):
+        if not _IDENTIFIER_PATTERN.match(part):
             return False
 
     # Block SQL keywords in the table part only (last element)
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Any
 
 _sensitive_values: set[str] = set()
+_sensitive_order: tuple[str, ...] = ()
+_sensitive_lock = threading.Lock()
 
 
 def register_sensitive_value(value: str | None) -> None:
+    global _sensitive_order
     if value:
-        _sensitive_values.add(value)
+        with _sensitive_lock:
+            _sensitive_values.add(value)
+            # Sorted once here rather than on every redact_sensitive() call
+            _sensitive_order = tuple(sorted(_sensitive_values, key=len, reverse=True))
 
 
 def redact_sensitive(value: Any) -> Any:
@@ -20,8 +27,7 @@ def redact_sensitive(value: Any) -> Any:
         return redact_sensitive(str(value))
     if isinstance(value, str):
         redacted = value
-        for sensitive in sorted(_sensitive_values, key=len, reverse=True):
-            if sensitive:
-                redacted = redacted.replace(sensitive, "<redacted>")
+        for sensitive in _sensitive_order:
+            redacted = redacted.replace(sensitive, "<redacted>")
         return redacted
     return value
@@ -10,6 +10,7 @@ Tests cover:
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from m4.core.datasets import (
     DatasetDefinition,
@@ -275,6 +276,91 @@ class TestDatasetRegistryEdgeCases:
         # Should not raise, just return silently
         assert DatasetRegistry.get("mimic-iv-demo") is not None
 
+    def test_load_custom_datasets_path_is_file(self, tmp_path):
+        """load_custom_datasets with a non-directory path does not crash."""
+        not_a_dir = tmp_path / "datasets"
+        not_a_dir.write_text("")
+
+        DatasetRegistry.reset()
+        DatasetRegistry.load_custom_datasets(not_a_dir)
+        assert DatasetRegistry.get("mimic-iv-demo") is not None
+
+    def test_load_custom_datasets_skips_unchanged_files(self, tmp_path):
+        """Reloading an unchanged directory keeps the registered definition."""
+        (tmp_path / "cached.json").write_text(json.dumps({"name": "custom-cached"}))
+
+        DatasetRegistry.reset()
+        DatasetRegistry.load_custom_datasets(tmp_path)
+        first = DatasetRegistry.get("custom-cached")
+        DatasetRegistry.load_custom_datasets(tmp_path)
+
+        assert DatasetRegistry.get("custom-cached") is first
+
+        DatasetRegistry.reset()
+
+    def test_load_custom_datasets_reloads_changed_files(self, tmp_path):
+        """Edited files are parsed again on the next load."""
+        json_path = tmp_path / "edited.json"
+        json_path.write_text(json.dumps({"name": "custom-edited"}))
+
+        DatasetRegistry.reset()
+        DatasetRegistry.load_custom_datasets(tmp_path)
+        json_path.write_text(
+            json.dumps({"name": "custom-edited", "description": "Updated"})
+        )
+        DatasetRegistry.load_custom_datasets(tmp_path)
+
+        assert DatasetRegistry.get("custom-edited").description == "Updated"
+
+        DatasetRegistry.reset()
+
+    def test_load_custom_datasets_after_reset_reregisters(self, tmp_path):
+        """reset() drops custom datasets even if their files are unchanged."""
+        (tmp_path / "again.json").write_text(json.dumps({"name": "custom-again"}))
+
+        DatasetRegistry.reset()
+        DatasetRegistry.load_custom_datasets(tmp_path)
+        DatasetRegistry.reset()
+        assert DatasetRegistry.get("custom-again") is None
+
+        DatasetRegistry.load_custom_datasets(tmp_path)
+        assert DatasetRegistry.get("custom-again") is not None
+
+        DatasetRegistry.reset()
+
+    def test_load_custom_datasets_reports_unchanged_invalid_file_once(
+        self, tmp_path, caplog
+    ):
+        """An invalid file is only re-read and re-reported once it changes."""
+        bad_file = tmp_path / "broken.json"
+        bad_file.write_text("{invalid json!!!}")
+
+        DatasetRegistry.reset()
+        with caplog.at_level("WARNING", logger="m4.core.datasets"):
+            DatasetRegistry.load_custom_datasets(tmp_path)
+            DatasetRegistry.load_custom_datasets(tmp_path)
+        assert len(caplog.records) == 1
+
+        bad_file.write_text(json.dumps({"name": "custom-fixed"}))
+        DatasetRegistry.load_custom_datasets(tmp_path)
+        assert DatasetRegistry.get("custom-fixed") is not None
+
+        DatasetRegistry.reset()
+
+    def test_load_custom_datasets_retries_unreadable_file(self, tmp_path):
+        """A file that could not be read is tried again on the next load."""
+        (tmp_path / "locked.json").write_text(json.dumps({"name": "custom-locked"}))
+
+        DatasetRegistry.reset()
+        with patch.object(Path, "read_text", side_effect=PermissionError("denied")):
+            DatasetRegistry.load_custom_datasets(tmp_path)
+        assert DatasetRegistry.get("custom-locked") is None
+
+        DatasetRegistry.load_custom_datasets(tmp_path)
+        assert DatasetRegistry.get("custom-locked") is not None
+
+        DatasetRegistry.reset()
+
     def test_load_custom_datasets_malformed_json(self, tmp_path):
         """Malformed JSON files are skipped gracefully."""
         (tmp_path / "bad.json").write_text("{invalid json!!!}")
@@ -1,5 +1,10 @@
 """Tests for SQL validation and parameter sanitization."""
 
+from unittest.mock import patch
+
+import pytest
+
+from m4.core import validation
 from m4.core.datasets import DatasetRegistry
 from m4.core.validation import (
     format_error_with_guidance,
@@ -8,6 +13,14 @@ from m4.core.validation import (
 )
 
 
+@pytest.fixture
+def clear_query_cache():
+    """Start with an empty is_safe_query() cache."""
+    validation._check_query.cache_clear()
+    yield
+    validation._check_query.cache_clear()
+
+
 class TestIsSafeQuery:
     """Tests for is_safe_query function."""
 
@@ -536,3 +549,19 @@ class TestIsSafeQueryRobustness:
         # is_safe_query expects str; passing None should return False gracefully
         is_safe, _ = is_safe_query(None)
         assert is_safe is False
+
+    def test_repeated_query_is_parsed_once(self, clear_query_cache):
+        """Validating the same SQL again reuses the memoized result."""
+        sql = "SELECT subject_id FROM patients WHERE anchor_age > 77"
+        with patch.object(
+            validation.sqlparse, "parse", wraps=validation.sqlparse.parse
+        ) as parse:
+            assert is_safe_query(sql) == (True, "Safe")
+            assert is_safe_query(sql) == (True, "Safe")
+        assert parse.call_count == 1
+
+    def test_unhashable_input_returns_false(self):
+        """Non-string input bypasses the cache and fails validation."""
+        is_safe, msg = is_safe_query(["SELECT 1"])
+        assert is_safe is False
+        assert msg.startswith("Validation error")
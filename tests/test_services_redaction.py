@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pytest
+
+from m4.services import redaction
+from m4.services.redaction import redact_sensitive, register_sensitive_value
+
+
+@pytest.fixture(autouse=True)
+def clean_sensitive_values(monkeypatch):
+    monkeypatch.setattr(redaction, "_sensitive_values", set())
+    monkeypatch.setattr(redaction, "_sensitive_order", ())
+
+
+def test_redact_sensitive_is_noop_without_registered_values():
+    payload = {"message": "nothing to hide", "count": 3}
+
+    assert redact_sensitive(payload) == payload
+
+
+def test_redact_sensitive_replaces_values_in_nested_payloads():
+    register_sensitive_value("hunter2")
+
+    assert redact_sensitive(
+        {
+            "error": "login failed for hunter2",
+            "attempts": ["hunter2", 2],
+            "path": Path("/tmp/hunter2/creds.json"),
+        }
+    ) == {
+        "error": "login failed for <redacted>",
+        "attempts": ["<redacted>", 2],
+        "path": "/tmp/<redacted>/creds.json",
+    }
+
+
+def test_redact_sensitive_prefers_longest_overlapping_value():
+    register_sensitive_value("pass")
+    register_sensitive_value("password123")
+
+    assert redact_sensitive("password123 and pass") == "<redacted> and <redacted>"
+
+
+def test_redact_sensitive_masks_longer_of_overlapping_values():
+    register_sensitive_value("aXb")
+    register_sensitive_value("Xbcdef")
+
+    assert redact_sensitive("aXbcdef") == "a<redacted>"
+
+
+def test_register_sensitive_value_matches_literally():
+    register_sensitive_value("a.b*c")
+    register_sensitive_value("")
+    register_sensitive_value(None)
+
+    assert redact_sensitive("a.b*c axbbc") == "<redacted> axbbc"